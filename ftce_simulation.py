@@ -12,17 +12,37 @@ Preregistration: https://osf.io/stc72
 Date: November 18, 2025
 """
 
+import math
+import operator
 import numpy as np
-from scipy.integrate import odeint
-from scipy.special import factorial
-import matplotlib.pyplot as plt
-from datetime import datetime, timedelta
 
 # Constants
 PHI = (1 + np.sqrt(5)) / 2  # Golden Ratio: 1.6180339887...
 PI = np.pi
 O = 9  # Ollin Identity
 
+# Energy accumulation: R(k) = 1 + (phi-1)*sin^2(pi*k/18)
+_PHI_MINUS_ONE = PHI - 1
+_PI_OVER_18 = PI / 18
+
+# phi-Encoding of E=mc^2: (phi/pi)^2 * (phi^2/(phi^2+1))^2
+_PHI_ENERGY_SCALE = (PHI / PI)**2 * (PHI**2 / (PHI**2 + 1))**2
+
+# Synchronicity amplification: phi^3
+_PHI_CUBED = PHI**3
+
+# Shumen Renouncement Transform phase: i*phi*pi
+_SHUMEN_PHASE = 1j * PHI * PI
+
+
+def _scale_array(x, scale):
+    """Multiply x by a constant, keeping x's floating dtype"""
+    x = np.asarray(x)
+    if np.issubdtype(x.dtype, np.floating):
+        scale = x.dtype.type(scale)
+    return np.multiply(x, scale)
+
+
 class FTCE:
     """
     Fundamental Theory of Conscious Energy
@@ -33,6 +53,11 @@ class FTCE:
         self.phi = PHI
         self.pi = PI
         self.ollin = O
+        # Argument-free resonances are constant; compute them once
+        self._resonance_factor = (
+            (9 * self.phi) / (self.phi + 8) * math.sin(self.pi / (2 * self.phi))
+        )
+        self._date_resonance = (9 * self.phi + 2 / self.phi + 8) ** (1 / self.phi)
         
     # ========== CORE AXIOMS ==========
     
@@ -47,6 +72,19 @@ class FTCE:
         """
         return 1999 + 9 * n + epsilon_n
     
+    def temporal_mapping_array(self, n_cycles, epsilon_n=0):
+        """
+        Temporal Mapping Function over cycles 0..n_cycles-1
+        f(t) = 1999 + 9*n + E(n)
+        
+        Args:
+            n_cycles: number of cycles
+            epsilon_n: phase adjustment, scalar or array of length n_cycles
+        Returns:
+            Array of years, one per cycle
+        """
+        return 1999 + 9 * np.arange(n_cycles, dtype=np.int64) + epsilon_n
+    
     # ========== SACRED GEOMETRY ==========
     
     def phi_encoded_energy(self, E):
@@ -55,13 +93,11 @@ class FTCE:
         E_phi = E * (phi/pi)^2 * (phi^2/(phi^2+1))^2
         
         Args:
-            E: Standard energy (E=mc^2)
+            E: Standard energy (E=mc^2), scalar or array of any shape
         Returns:
-            Phi-encoded energy
+            Phi-encoded energy, same shape as E
         """
-        term1 = (self.phi / self.pi) ** 2
-        term2 = (self.phi**2 / (self.phi**2 + 1)) ** 2
-        return E * term1 * term2
+        return _scale_array(E, _PHI_ENERGY_SCALE)
     
     def resonance_factor(self):
         """
@@ -71,9 +107,7 @@ class FTCE:
         Returns:
             Resonance amplification factor (~1.2492)
         """
-        term1 = (9 * self.phi) / (self.phi + 8)
-        term2 = np.sin(self.pi / (2 * self.phi))
-        return term1 * term2
+        return self._resonance_factor
     
     # ========== WAVE PROPAGATION ==========
     
@@ -102,13 +136,31 @@ class FTCE:
         Returns:
             Accumulated energy after n cycles
         """
-        R = self.resonance_factor()
         # Product of R(k) where R(k) = 1 + (phi-1)*sin^2(pi*k/18)
-        product = 1
-        for k in range(1, n+1):
-            R_k = 1 + (self.phi - 1) * np.sin(self.pi * k / 18)**2
-            product *= R_k
-        return E_base * product
+        k = np.arange(1, operator.index(n) + 1)
+        R_k = 1 + _PHI_MINUS_ONE * np.sin(_PI_OVER_18 * k)**2
+        return E_base * R_k.prod()
+    
+    def energy_accumulation_batch(self, ns, E_base):
+        """
+        Energy Accumulation Model over many cycle counts at once
+        E_accumulated(n) = E_base * Product[R(k) for k=1 to n]
+        
+        Args:
+            ns: array of integer cycle counts (n <= 0 gives E_base)
+            E_base: base energy
+        Returns:
+            Accumulated energy for each n in ns, same shape as ns
+        """
+        ns = np.asarray(ns)
+        if not np.issubdtype(ns.dtype, np.integer):
+            raise TypeError("ns must contain integer cycle counts")
+        ns = np.maximum(ns, 0)
+        k = np.arange(1, ns.max(initial=0) + 1)
+        R_k = 1 + _PHI_MINUS_ONE * np.sin(_PI_OVER_18 * k)**2
+        # Leading 1 is the empty product, so n=0 maps to E_base
+        products = np.concatenate(([1.0], np.cumprod(R_k)))
+        return E_base * products[ns]
     
     # ========== SYNCHRONICITY ==========
     
@@ -118,11 +170,11 @@ class FTCE:
         P_Ollin = P_random * phi^3
         
         Args:
-            P_random: baseline random probability
+            P_random: baseline random probability, scalar or array
         Returns:
-            Amplified probability through coherence
+            Amplified probability through coherence, same shape as P_random
         """
-        return P_random * (self.phi ** 3)
+        return _scale_array(P_random, _PHI_CUBED)
     
     def date_resonance(self):
         """
@@ -132,21 +184,42 @@ class FTCE:
         Returns:
             Resonance value (should be approximately 8)
         """
-        return (9 * self.phi + 2 / self.phi + 8) ** (1 / self.phi)
+        return self._date_resonance
+    
+    def shumen_operator(self, M):
+        """
+        Shumen Renouncement Operator
+        U = exp(i*phi*pi*M)  (matrix exponential)
+        
+        Args:
+            M: Metamorphosis matrix, square 2-D array
+        Returns:
+            U: Transform operator (unitary when M is Hermitian)
+        """
+        # SciPy is only needed here; keep it off the module import path
+        from scipy.linalg import expm
+        
+        M = np.asarray(M)
+        if M.ndim != 2 or M.shape[0] != M.shape[1]:
+            raise ValueError(f"M must be a square 2-D matrix, got shape {M.shape}")
+        return expm(_SHUMEN_PHASE * M)
     
-    def shumen_transform(self, S, M):
+    def shumen_transform(self, S, M, precomputed_operator=None):
         """
         The Shumen Renouncement Transform
-        N = exp(i*phi*pi*M) * S
+        N = expm(i*phi*pi*M) @ S
         
         Args:
             S: Old State vector
-            M: Metamorphosis matrix
+            M: Metamorphosis matrix, square 2-D array
+            precomputed_operator: optional result of shumen_operator(M),
+                reused to skip the matrix exponential on repeated calls
         Returns:
             N: New State vector
         """
-        transform_operator = np.exp(1j * self.phi * self.pi * M)
-        return transform_operator * S
+        if precomputed_operator is None:
+            precomputed_operator = self.shumen_operator(M)
+        return precomputed_operator @ S
     
     # ========== CONSCIOUSNESS DYNAMICS ==========
     
@@ -208,8 +281,7 @@ if __name__ == "__main__":
     
     # Temporal mapping
     print(f"\nTemporal Cycles from birth year 1999:")
-    for n in range(0, 4):
-        year = ftce.temporal_mapping(n)
+    for n, year in enumerate(ftce.temporal_mapping_array(4)):
         print(f"  Cycle {n}: Year {year}")
     
     # Energy encoding
@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+
+from ftce_simulation import FTCE
+
+
+@pytest.fixture
+def ftce():
+    return FTCE()
+
+
+# ========== ENERGY ==========
+
+def test_energy_accumulation_batch_matches_scalar(ftce):
+    ns = np.array([0, 1, 5, 10, 20, 3])
+    batch = ftce.energy_accumulation_batch(ns, 2.5)
+    expected = [ftce.energy_accumulation(int(n), 2.5) for n in ns]
+    np.testing.assert_allclose(batch, expected)
+    assert batch[0] == 2.5
+
+
+def test_energy_accumulation_batch_clips_negative_counts(ftce):
+    batch = ftce.energy_accumulation_batch([-1, 3], 1.0)
+    assert batch[0] == ftce.energy_accumulation(-1, 1.0) == 1.0
+
+
+def test_energy_accumulation_batch_rejects_non_integer_counts(ftce):
+    with pytest.raises(TypeError):
+        ftce.energy_accumulation_batch([2.7, 3], 1.0)
+
+
+def test_energy_helpers_preserve_float_dtype(ftce):
+    E = np.ones((2, 3), dtype=np.float32)
+    assert ftce.phi_encoded_energy(E).dtype == np.float32
+    assert ftce.probability_amplification(E).dtype == np.float32
+    assert ftce.phi_encoded_energy(E).shape == (2, 3)
+
+
+# ========== TEMPORAL MAPPING ==========
+
+def test_temporal_mapping_array_matches_scalar(ftce):
+    years = ftce.temporal_mapping_array(4)
+    assert years.dtype.kind == "i"
+    assert list(years) == [ftce.temporal_mapping(n) for n in range(4)]
+
+
+# ========== SHUMEN TRANSFORM ==========
+
+SIGMA_X = np.array([[0, 1], [1, 0]])
+
+
+def test_shumen_operator_matches_pauli_closed_form(ftce):
+    # expm(i*theta*sigma_x) = cos(theta)*I + i*sin(theta)*sigma_x
+    theta = ftce.phi * ftce.pi
+    expected = np.cos(theta) * np.eye(2) + 1j * np.sin(theta) * SIGMA_X
+    np.testing.assert_allclose(ftce.shumen_operator(SIGMA_X), expected, atol=1e-12)
+
+
+def test_shumen_operator_is_unitary_for_hermitian_m(ftce):
+    rng = np.random.default_rng(9)
+    A = rng.normal(size=(4, 4)) + 1j * rng.normal(size=(4, 4))
+    M = (A + A.conj().T) / 2
+    U = ftce.shumen_operator(M)
+    np.testing.assert_allclose(U.conj().T @ U, np.eye(4), atol=1e-12)
+
+
+def test_shumen_transform_precomputed_operator_matches_default(ftce):
+    S = np.array([1.0, 0.5])
+    U = ftce.shumen_operator(SIGMA_X)
+    np.testing.assert_allclose(
+        ftce.shumen_transform(S, SIGMA_X, precomputed_operator=U),
+        ftce.shumen_transform(S, SIGMA_X),
+    )
+
+
+@pytest.mark.parametrize("M", [2.0, np.ones(3), np.ones((2, 3))])
+def test_shumen_operator_rejects_non_square_matrix(ftce, M):
+    with pytest.raises(ValueError, match="square 2-D matrix"):
+        ftce.shumen_operator(M)